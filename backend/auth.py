@@ -5,7 +5,7 @@ Security: Uses bcrypt for password hashing (production-ready)
 """
 
 import re
-from typing import Dict, Optional, Tuple
+from typing import Callable, Dict, Optional, Tuple
 from datetime import datetime
 
 try:
@@ -219,7 +219,8 @@ def register_user(
     email: str,
     password: str,
     role: str,
-    profile: Dict
+    profile: Dict,
+    hasher: Callable[[str], str] = hash_password
 ) -> Dict:
     """
     Register new user with role-based profile validation
@@ -229,6 +230,7 @@ def register_user(
         password: Plain text password
         role: User role (patient, doctor, physio)
         profile: Role-specific profile data
+        hasher: Password hashing function (defaults to hash_password)
     
     Returns:
         Created user dictionary (without password_hash)
@@ -266,7 +268,7 @@ def register_user(
         raise ValidationError(f"Profile validation failed: {str(e)}")
     
     # Hash password
-    password_hash = hash_password(password)
+    password_hash = hasher(password)
     
     # Create user object
     user_data = {
@@ -289,7 +291,11 @@ def register_user(
         raise AuthError(f"Registration failed: {str(e)}")
 
 
-def login_user(identifier: str, password: str) -> Dict:
+def login_user(
+    identifier: str,
+    password: str,
+    verifier: Callable[[str, str], bool] = verify_password
+) -> Dict:
     """
     Authenticate user and return user data with role
     Supports login with either email or username
@@ -297,6 +303,7 @@ def login_user(identifier: str, password: str) -> Dict:
     Args:
         identifier: User's email address or username
         password: Plain text password
+        verifier: Password check function (defaults to verify_password)
     
     Returns:
         User dictionary with role (without password_hash)
@@ -319,7 +326,7 @@ def login_user(identifier: str, password: str) -> Dict:
     
     # Verify password
     stored_password = user.get('password_hash') or user.get('password', '')
-    if not verify_password(password, stored_password):
+    if not verifier(password, stored_password):
         raise AuthError("Invalid credentials")
     
     # Update last login timestamp
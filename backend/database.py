@@ -17,6 +17,9 @@ _file_lock = Lock()
 DATA_DIR = Path(__file__).parent.parent / "data"
 USERS_DB = DATA_DIR / "users.json"
 
+# Credential fields that must never leave the data layer in public lookups
+PRIVATE_USER_FIELDS = ('password_hash', 'password')
+
 
 class DatabaseError(Exception):
     """Custom exception for database operations"""
@@ -177,6 +180,42 @@ def find_user_by_id(user_id: int) -> Optional[Dict[str, Any]]:
     return None
 
 
+def find_user_by_id_public(user_id: int) -> Optional[Dict[str, Any]]:
+    """
+    Find user by ID, returning only public fields (no password hash)
+    
+    Args:
+        user_id: User's unique identifier
+    
+    Returns:
+        Public user dictionary if found, None otherwise
+    """
+    for user in get_all_users():
+        if user.get('id') == user_id:
+            return {k: v for k, v in user.items() if k not in PRIVATE_USER_FIELDS}
+    
+    return None
+
+
+def find_users_by_ids(user_ids: List[Any]) -> Dict[Any, Dict[str, Any]]:
+    """
+    Find multiple users by ID with a single database read
+    
+    Args:
+        user_ids: List of user identifiers
+    
+    Returns:
+        Dictionary mapping each found ID to its user dictionary
+    """
+    wanted = set(user_ids)
+    
+    return {
+        user.get('id'): user
+        for user in get_all_users()
+        if user.get('id') in wanted
+    }
+
+
 def get_next_user_id() -> int:
     """
     Generate next available user ID
@@ -0,0 +1,57 @@
+"""
+NeuroTrack API Response Schemas
+Typed response bodies encoded directly by msgspec
+"""
+
+from typing import Any, Dict, List
+
+import msgspec
+
+
+class UserResponse(msgspec.Struct):
+    """Successful register/login response"""
+    success: bool
+    message: str
+    user: Dict[str, Any]
+
+
+class ProfileResponse(msgspec.Struct):
+    """Single user profile response"""
+    success: bool
+    user: Dict[str, Any]
+
+
+class ProfilesResponse(msgspec.Struct):
+    """Batch user profile response"""
+    success: bool
+    users: List[Dict[str, Any]]
+
+
+class EmailCheckResponse(msgspec.Struct):
+    """Email availability response"""
+    success: bool
+    available: bool
+
+
+class ErrorResponse(msgspec.Struct):
+    """Error response returned by endpoint-level failures (not_found, etc.)"""
+    success: bool
+    error: str
+    message: str
+
+
+# Shared encoder instance (reused across requests)
+_encoder = msgspec.json.Encoder()
+
+
+def encode_json(obj: Any) -> bytes:
+    """
+    Encode a response schema to JSON bytes
+    
+    Args:
+        obj: Response struct (or any msgspec-encodable value)
+    
+    Returns:
+        UTF-8 encoded JSON
+    """
+    return _encoder.encode(obj)
@@ -0,0 +1,30 @@
+"""
+NeuroTrack Gunicorn Configuration
+Run with: gunicorn -c gunicorn.conf.py wsgi:application
+"""
+
+import os
+
+# Server socket
+bind = os.environ.get('NEUROTRACK_BIND', '0.0.0.0:5000')
+
+# Worker processes (cooperative greenlets for I/O-bound endpoints)
+# NOTE: the JSON-file store only locks within a process and all writers
+# share one temp file, so concurrent writes from several workers can
+# corrupt users.json. Keep a single worker (concurrency comes from gevent
+# greenlets) until the storage layer moves to a real database; only then
+# raise WEB_CONCURRENCY, e.g. to 2 * cpu_count + 1.
+workers = int(os.environ.get('WEB_CONCURRENCY', 1))
+worker_class = 'gevent'
+worker_connections = 1000
+
+# Each worker also owns a bcrypt pool of NEUROTRACK_HASH_WORKERS processes
+# (default 1, spawned on first register/login), so a host runs up to
+# workers * (1 + NEUROTRACK_HASH_WORKERS) NeuroTrack processes in total.
+
+# Keep client connections open between requests
+keepalive = 5
+
+# Logging
+accesslog = '-'
+errorlog = '-'
@@ -3,90 +3,485 @@ NeuroTrack Flask API Server
 REST API endpoints for authentication and user management
 """
 
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, request, send_from_directory
 from flask_cors import CORS
-from typing import Dict, Any
-import traceback
+from flask_compress import Compress
+from cachetools import TTLCache
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from typing import Dict, Any, Tuple
+from werkzeug.exceptions import NotFound
+from werkzeug.routing import BaseConverter
+from werkzeug.security import safe_join
+import logging
+import mimetypes
+import multiprocessing
+import threading
+import msgspec
+import orjson
+import time
+import re
 import os
 
+try:
+    from gevent.event import AsyncResult
+    from gevent.monkey import is_module_patched
+    GEVENT_AVAILABLE = True
+except ImportError:
+    GEVENT_AVAILABLE = False
+
 from backend.auth import (
     register_user,
     login_user,
+    hash_password,
+    verify_password,
     AuthError,
     ValidationError
 )
-from backend.database import DatabaseError
+from backend.schemas import (
+    encode_json,
+    UserResponse,
+    ProfileResponse,
+    ProfilesResponse,
+    EmailCheckResponse,
+    ErrorResponse
+)
+from backend.database import (
+    find_user_by_email,
+    find_user_by_id_public,
+    find_users_by_ids,
+    DatabaseError,
+    PRIVATE_USER_FIELDS
+)
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger('neurotrack')
+
+
+class BoundedIntConverter(BaseConverter):
+    """URL converter for positive user IDs of at most 10 digits"""
+    
+    regex = r'[1-9][0-9]{0,9}'
+    
+    def to_python(self, value: str) -> int:
+        return int(value)
+    
+    def to_url(self, value: int) -> str:
+        return str(value)
+
+
+app = Flask(__name__, static_folder=None, template_folder='pages', host_matching=False)
+
+# '/api/auth/register/' should not trigger a redirect to the canonical URL
+app.url_map.strict_slashes = False
+app.url_map.converters['uid'] = BoundedIntConverter
 
-app = Flask(__name__, static_folder='assets', template_folder='pages')
+# Debug tooling (reloader, interactive debugger) only in development
+FLASK_ENV = os.environ.get('FLASK_ENV', 'production')
+DEBUG = FLASK_ENV == 'development'
+
+if not DEBUG:
+    app.config['PROPAGATE_EXCEPTIONS'] = False
+    app.config['TRAP_HTTP_EXCEPTIONS'] = False
+
+# Compress JSON/HTML/CSS/JS responses (Brotli preferred, gzip fallback)
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_MIN_SIZE'] = 512
+Compress(app)
 
 # Enable CORS for frontend integration
 CORS(app, resources={
     r"/api/*": {
         "origins": ["http://localhost:*", "http://127.0.0.1:*"],
         "methods": ["GET", "POST", "OPTIONS"],
-        "allow_headers": ["Content-Type"]
+        "allow_headers": ["Content-Type"],
+        "supports_credentials": False,
+        "send_wildcard": False,
+        # Let browsers cache preflight results for a day
+        "max_age": 86400
     }
 })
 
 
+# ==================== REQUEST & RESPONSE HELPERS ====================
+
+def json_response(body: bytes, status: int = 200):
+    """Wrap an already-encoded JSON body in a response"""
+    return app.response_class(body, status=status, mimetype='application/json')
+
+
+def respond(body: msgspec.Struct, status: int = 200):
+    """Encode a response schema with msgspec and wrap it in a JSON response"""
+    return json_response(encode_json(body), status)
+
+
+def parse_json_body() -> Any:
+    """
+    Decode the raw request body with orjson
+
+    Returns:
+        Decoded JSON value, or None if the body is empty
+
+    Raises:
+        ValidationError: If the body is not valid JSON
+    """
+    raw = request.get_data(cache=False)
+    if not raw:
+        return None
+
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        raise ValidationError("Invalid JSON")
+
+
+# Normalized credential fields pulled from an auth request body
+Credentials = namedtuple('Credentials', ['email', 'identifier', 'password', 'role', 'profile'])
+
+
+def _norm(value: str, lower: bool = False) -> str:
+    """Strip (and optionally lowercase) value, reusing it when already clean"""
+    if not value:
+        return ''
+    
+    if lower and not value.islower():
+        value = value.lower()
+    
+    if value[0].isspace() or value[-1].isspace():
+        value = value.strip()
+    
+    return value
+
+
+def _extract_creds(data: Dict[str, Any]) -> Credentials:
+    """
+    Extract normalized credentials from a request body in one pass
+    
+    The login identifier falls back to the email when not supplied.
+    """
+    email = _norm(data.get('email'))
+    
+    return Credentials(
+        email=email,
+        identifier=_norm(data.get('identifier')) or email,
+        password=data.get('password', ''),
+        role=_norm(data.get('role'), lower=True),
+        profile=data.get('profile', {})
+    )
+
+
+# ==================== PASSWORD HASHING POOL ====================
+
+# bcrypt is CPU-bound; hash/verify passwords in worker processes so the
+# server (and the gevent event loop) stays responsive meanwhile. Only the
+# hashing runs there - all database reads/writes stay in this process.
+# One small pool per server worker process (see gunicorn.conf.py)
+HASH_POOL_WORKERS = int(os.environ.get('NEUROTRACK_HASH_WORKERS', 1))
+
+_hash_pool = None
+_hash_pool_lock = threading.Lock()
+
+
+def get_hash_pool() -> ProcessPoolExecutor:
+    """
+    Return this process's hashing pool, creating it on first use
+    
+    Created lazily so each gunicorn worker builds its own pool after the
+    fork. Pool processes are spawned (not forked) so they don't inherit
+    server threads or gevent monkey-patching.
+    """
+    global _hash_pool
+    
+    if _hash_pool is None:
+        with _hash_pool_lock:
+            if _hash_pool is None:
+                _hash_pool = ProcessPoolExecutor(
+                    max_workers=HASH_POOL_WORKERS,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+    
+    return _hash_pool
+
+
+def _discard_hash_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next get_hash_pool() builds a fresh one"""
+    global _hash_pool
+    
+    with _hash_pool_lock:
+        if _hash_pool is pool:
+            _hash_pool = None
+    
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def run_in_hash_pool(fn, *args):
+    """
+    Run fn(*args) in the hashing process pool and return its result
+    
+    Under gevent only the calling greenlet is suspended while waiting.
+    Exceptions raised by fn propagate unchanged from this call (never from
+    a hub callback, so the gevent hub doesn't log them).
+    
+    If a pool process died (OOM kill, segfault, ...), the broken pool is
+    replaced and the call is retried once; fn must be safe to re-run.
+    """
+    for attempt in range(2):
+        pool = get_hash_pool()
+        
+        try:
+            future = pool.submit(fn, *args)
+            
+            if GEVENT_AVAILABLE and is_module_patched('threading'):
+                # Completion callbacks may fire on another thread; AsyncResult
+                # is safe to set cross-thread and wakes just this greenlet
+                done = AsyncResult()
+                future.add_done_callback(lambda _: done.set())
+                done.wait()
+            
+            return future.result()
+        
+        except BrokenProcessPool:
+            logger.warning("Hash pool broken, restarting it")
+            _discard_hash_pool(pool)
+            if attempt:
+                raise
+
+
+def pooled_hash_password(password: str) -> str:
+    """hash_password() run in the hashing process pool"""
+    return run_in_hash_pool(hash_password, password)
+
+
+def pooled_verify_password(password: str, password_hash: str) -> bool:
+    """verify_password() run in the hashing process pool"""
+    return run_in_hash_pool(verify_password, password, password_hash)
+
+
+# ==================== PREBUILT RESPONSE BODIES ====================
+
+# Constant payloads are encoded once at import time
+_HEALTH_BYTES = orjson.dumps({
+    'success': True,
+    'status': 'healthy',
+    'service': 'NeuroTrack API',
+    'version': '1.0'
+})
+
+_DATABASE_ERROR_BYTES = orjson.dumps({
+    'success': False,
+    'error': 'database_error',
+    'message': 'An error occurred while processing your request'
+})
+
+_INTERNAL_ERROR_BYTES = orjson.dumps({
+    'success': False,
+    'error': 'internal_error',
+    'message': 'An unexpected error occurred'
+})
+
+# Templates for errors carrying a message; fill with orjson.dumps(message)
+_VALIDATION_TPL = b'{"success":false,"error":"validation_error","message":%s}'
+_AUTH_TPL = b'{"success":false,"error":"auth_error","message":%s}'
+
+
 # ==================== ERROR HANDLERS ====================
 
 @app.errorhandler(ValidationError)
 def handle_validation_error(error):
     """Handle validation errors"""
-    return jsonify({
-        'success': False,
-        'error': 'validation_error',
-        'message': str(error)
-    }), 400
+    return json_response(_VALIDATION_TPL % orjson.dumps(str(error)), 400)
 
 
 @app.errorhandler(AuthError)
 def handle_auth_error(error):
     """Handle authentication errors"""
-    return jsonify({
-        'success': False,
-        'error': 'auth_error',
-        'message': str(error)
-    }), 401
+    return json_response(_AUTH_TPL % orjson.dumps(str(error)), 401)
 
 
 @app.errorhandler(DatabaseError)
 def handle_database_error(error):
     """Handle database errors"""
-    return jsonify({
-        'success': False,
-        'error': 'database_error',
-        'message': 'An error occurred while processing your request'
-    }), 500
+    return json_response(_DATABASE_ERROR_BYTES, 500)
 
 
 @app.errorhandler(500)
 def handle_internal_error(error):
     """Handle unexpected errors"""
-    return jsonify({
-        'success': False,
-        'error': 'internal_error',
-        'message': 'An unexpected error occurred'
-    }), 500
+    return json_response(_INTERNAL_ERROR_BYTES, 500)
+
+
+# ==================== CACHE POLICY ====================
+
+# Fingerprinted bundles (e.g. app.3f9a1c2b.js) never change content
+_HASHED_ASSET_RE = re.compile(r'.*\.[0-9a-f]{8,}\.(js|css|png|woff2)$')
+
+# API prefixes whose responses may carry credentials or personal data
+_NO_STORE_PREFIXES = ('/api/auth', '/api/users')
+
+
+@app.after_request
+def apply_cache_policy(response):
+    """Set Cache-Control per route family"""
+    # Preflight caching is governed by Access-Control-Max-Age instead
+    if request.method == 'OPTIONS':
+        return response
+
+    path = request.path
+
+    if path.startswith(_NO_STORE_PREFIXES):
+        # Views may opt in to a (private) policy of their own
+        if 'Cache-Control' not in response.headers:
+            response.headers['Cache-Control'] = 'no-store'
+    elif path == '/api/health':
+        response.headers['Cache-Control'] = 'public, max-age=30'
+    elif path.startswith('/assets/') and _HASHED_ASSET_RE.match(path):
+        response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+
+    return response
 
 
 # ==================== STATIC FILE SERVING ====================
 
+# Browser cache lifetime for static pages/assets (seconds)
+STATIC_MAX_AGE = 86400
+
+# How long a cached stat() result is trusted before re-checking the file
+_STAT_TTL = 2
+
+
+@lru_cache(maxsize=512)
+def _stat_file(path: str, ttl_bucket: int) -> Tuple[int, int]:
+    """Return (mtime_ns, size) for path; ttl_bucket expires the entry"""
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def _file_etag(mtime_ns: int, size: int) -> str:
+    """Build an Apache-style mtime+size ETag"""
+    return f'{mtime_ns:x}-{size:x}'
+
+
+def _not_modified(etag: str, max_age: int):
+    """
+    Return a 304 response if If-None-Match matches etag, otherwise None
+
+    Compressed variants carry the algorithm as a suffix (e.g. "<etag>:br").
+    """
+    matched = next(
+        (tag for tag in request.if_none_match
+         if tag == etag or tag.startswith(etag + ':')),
+        None
+    )
+
+    if not matched:
+        return None
+
+    response = app.response_class(status=304)
+    response.set_etag(matched)
+    response.cache_control.public = True
+    response.cache_control.max_age = max_age
+    return response
+
+
+def send_static_cached(folder: str, filename: str, max_age: int = STATIC_MAX_AGE):
+    """
+    Serve a static file with an mtime+size ETag and public Cache-Control
+
+    Conditional requests whose If-None-Match matches the current ETag are
+    answered with 304 Not Modified without opening the file.
+    """
+    path = safe_join(os.path.join(app.root_path, folder), filename)
+    if path is None:
+        raise NotFound()
+
+    try:
+        mtime_ns, size = _stat_file(path, int(time.monotonic() // _STAT_TTL))
+    except OSError:
+        raise NotFound()
+
+    etag = _file_etag(mtime_ns, size)
+
+    not_modified = _not_modified(etag, max_age)
+    if not_modified:
+        return not_modified
+
+    # Conditional handling already done above
+    return send_from_directory(
+        folder, filename, etag=etag, max_age=max_age, conditional=False
+    )
+
+
+# HTML pages change more often than assets
+PAGE_MAX_AGE = 60
+
+
+def load_page_cache(folder: str = 'pages') -> Dict[str, Tuple[bytes, str, str]]:
+    """
+    Read every page under folder into memory
+
+    Returns:
+        Dictionary mapping relative path to (body, etag, content_type)
+    """
+    root = os.path.join(app.root_path, folder)
+    cache = {}
+
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            with open(path, 'rb') as f:
+                st = os.fstat(f.fileno())
+                body = f.read()
+
+            key = os.path.relpath(path, root).replace(os.sep, '/')
+            content_type = mimetypes.guess_type(name)[0] or 'application/octet-stream'
+            cache[key] = (body, _file_etag(st.st_mtime_ns, st.st_size), content_type)
+
+    return cache
+
+
+_PAGE_CACHE = load_page_cache()
+
+
+def send_page(filename: str):
+    """
+    Serve a page from the in-memory page cache
+
+    In debug mode, and for files added after startup, pages are read from
+    disk instead so edits show up without a restart.
+    """
+    cached = None if app.debug else _PAGE_CACHE.get(filename)
+    if cached is None:
+        return send_static_cached('pages', filename, PAGE_MAX_AGE)
+
+    body, etag, content_type = cached
+
+    not_modified = _not_modified(etag, PAGE_MAX_AGE)
+    if not_modified:
+        return not_modified
+
+    response = app.response_class(body, mimetype=content_type)
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = PAGE_MAX_AGE
+    return response
+
+
 @app.route('/')
 def index():
     """Redirect to login page"""
-    return send_from_directory('pages', 'login.html')
+    return send_page('login.html')
 
 @app.route('/pages/<path:filename>')
 def serve_pages(filename):
     """Serve HTML pages"""
-    return send_from_directory('pages', filename)
+    return send_page(filename)
 
 @app.route('/assets/<path:filename>')
 def serve_assets(filename):
     """Serve static assets (CSS, JS, images)"""
-    return send_from_directory('assets', filename)
+    return send_static_cached('assets', filename)
 
 @app.route('/data/<path:filename>')
 def serve_data(filename):
@@ -96,20 +491,15 @@ def serve_data(filename):
 
 # ==================== HEALTH CHECK ====================
 
-@app.route('/api/health', methods=['GET'])
+@app.route('/api/health', methods=['GET'], provide_automatic_options=False)
 def health_check():
     """Health check endpoint"""
-    return jsonify({
-        'success': True,
-        'status': 'healthy',
-        'service': 'NeuroTrack API',
-        'version': '1.0'
-    })
+    return json_response(_HEALTH_BYTES)
 
 
 # ==================== AUTHENTICATION ENDPOINTS ====================
 
-@app.route('/api/auth/register', methods=['POST'])
+@app.route('/api/auth/register', methods=['POST'], provide_automatic_options=False)
 def api_register():
     """
     Register new user
@@ -138,36 +528,36 @@ def api_register():
         }
     """
     try:
-        data = request.get_json()
+        data = parse_json_body()
         
         if not data:
             raise ValidationError("Request body is required")
         
         # Extract fields
-        email = data.get('email', '').strip()
-        password = data.get('password', '')
-        role = data.get('role', '').strip().lower()
-        profile = data.get('profile', {})
+        creds = _extract_creds(data)
         
         # Register user
-        user = register_user(email, password, role, profile)
+        user = register_user(
+            creds.email, creds.password, creds.role, creds.profile,
+            hasher=pooled_hash_password
+        )
         
-        return jsonify({
-            'success': True,
-            'message': 'Registration successful',
-            'user': user
-        }), 201
+        return respond(UserResponse(
+            success=True,
+            message='Registration successful',
+            user=user
+        ), 201)
         
     except (ValidationError, AuthError) as e:
         # Let error handlers catch these
         raise
     except Exception as e:
         # Log unexpected errors
-        print(f"Registration error: {traceback.format_exc()}")
+        logger.exception("Registration error")
         raise DatabaseError("Registration failed")
 
 
-@app.route('/api/auth/login', methods=['POST'])
+@app.route('/api/auth/login', methods=['POST'], provide_automatic_options=False)
 def api_login():
     """
     Authenticate user
@@ -192,35 +582,59 @@ def api_login():
         }
     """
     try:
-        data = request.get_json()
+        data = parse_json_body()
         
         if not data:
             raise ValidationError("Request body is required")
         
         # Extract credentials (support both email and identifier)
-        identifier = data.get('identifier') or data.get('email', '')
-        identifier = identifier.strip()
-        password = data.get('password', '')
+        creds = _extract_creds(data)
         
         # Authenticate
-        user = login_user(identifier, password)
+        user = login_user(creds.identifier, creds.password, verifier=pooled_verify_password)
         
-        return jsonify({
-            'success': True,
-            'message': 'Login successful',
-            'user': user
-        }), 200
+        return respond(UserResponse(
+            success=True,
+            message='Login successful',
+            user=user
+        ), 200)
         
     except (ValidationError, AuthError) as e:
         # Let error handlers catch these
         raise
     except Exception as e:
         # Log unexpected errors
-        print(f"Login error: {traceback.format_exc()}")
+        logger.exception("Login error")
         raise DatabaseError("Login failed")
 
 
-@app.route('/api/auth/check-email', methods=['POST'])
+# Check-email fires on every keystroke; absorb bursts for the same address
+EMAIL_CHECK_CACHE_TTL = 30
+
+
+# Only "taken" results are cached: they can't go stale when someone
+# registers, and the cache is per worker process so a cached "available"
+# could disagree with a registration handled by another worker
+_taken_emails = TTLCache(maxsize=10_000, ttl=EMAIL_CHECK_CACHE_TTL)
+_taken_emails_lock = threading.Lock()
+
+
+def _email_registered(email_lower: str) -> bool:
+    """Return True if email_lower belongs to an existing user (cached if so)"""
+    with _taken_emails_lock:
+        if email_lower in _taken_emails:
+            return True
+    
+    if find_user_by_email(email_lower) is None:
+        return False
+    
+    with _taken_emails_lock:
+        _taken_emails[email_lower] = True
+    
+    return True
+
+
+@app.route('/api/auth/check-email', methods=['POST'], provide_automatic_options=False)
 def api_check_email():
     """
     Check if email is already registered (for real-time validation)
@@ -237,33 +651,36 @@ def api_check_email():
         }
     """
     try:
-        data = request.get_json()
+        data = parse_json_body()
         
         if not data:
             raise ValidationError("Request body is required")
         
-        email = data.get('email', '').strip()
+        email = _norm(data.get('email'), lower=True)
         
-        from backend.database import find_user_by_email
-        user = find_user_by_email(email)
+        response = respond(EmailCheckResponse(
+            success=True,
+            available=not _email_registered(email)
+        ), 200)
+        response.headers['Cache-Control'] = 'private, max-age=10'
         
-        return jsonify({
-            'success': True,
-            'available': user is None
-        }), 200
+        return response
         
+    except ValidationError:
+        # Let error handlers catch these
+        raise
     except Exception as e:
-        print(f"Email check error: {traceback.format_exc()}")
-        return jsonify({
-            'success': False,
-            'error': 'check_failed',
-            'message': 'Could not check email availability'
-        }), 500
+        logger.exception("Email check error")
+        return respond(ErrorResponse(
+            success=False,
+            error='check_failed',
+            message='Could not check email availability'
+        ), 500)
 
 
 # ==================== USER MANAGEMENT ====================
 
-@app.route('/api/users/profile/<int:user_id>', methods=['GET'])
+@app.route('/api/users/profile/<uid:user_id>', methods=['GET'], provide_automatic_options=False)
 def api_get_profile(user_id):
     """
     Get user profile by ID
@@ -275,41 +692,148 @@ def api_get_profile(user_id):
         }
     """
     try:
-        from backend.database import find_user_by_id
-        
-        user = find_user_by_id(user_id)
+        user = find_user_by_id_public(user_id)
         
         if not user:
-            return jsonify({
-                'success': False,
-                'error': 'not_found',
-                'message': 'User not found'
-            }), 404
+            return respond(ErrorResponse(
+                success=False,
+                error='not_found',
+                message='User not found'
+            ), 404)
+        
+        return respond(ProfileResponse(
+            success=True,
+            user=user
+        ), 200)
+        
+    except Exception as e:
+        logger.exception("Profile fetch error")
+        return respond(ErrorResponse(
+            success=False,
+            error='fetch_failed',
+            message='Could not retrieve profile'
+        ), 500)
+
+
+# Upper bound on IDs accepted by a single batch profile request
+MAX_BATCH_PROFILE_IDS = 200
+
+
+@app.route('/api/users/profiles', methods=['POST'], provide_automatic_options=False)
+def api_get_profiles():
+    """
+    Get multiple user profiles in one request
+    
+    Request Body:
+        {
+            "ids": [1, 2, 3]
+        }
+    
+    Response:
+        {
+            "success": true,
+            "users": [{...}, {...}]
+        }
+    """
+    try:
+        data = parse_json_body()
         
-        # Remove password_hash
-        response_user = {k: v for k, v in user.items() if k != 'password_hash'}
+        if not data:
+            raise ValidationError("Request body is required")
+        
+        ids = data.get('ids')
+        
+        if not isinstance(ids, list) or not ids:
+            raise ValidationError("ids must be a non-empty list")
+        
+        if len(ids) > MAX_BATCH_PROFILE_IDS:
+            raise ValidationError(f"At most {MAX_BATCH_PROFILE_IDS} ids per request")
+        
+        if not all(isinstance(i, (int, str)) and not isinstance(i, bool) for i in ids):
+            raise ValidationError("ids must contain only integers or strings")
         
-        return jsonify({
-            'success': True,
-            'user': response_user
-        }), 200
+        found = find_users_by_ids(ids)
         
+        # Preserve request order, skip unknown and duplicate IDs
+        users = []
+        seen = set()
+        for user_id in ids:
+            user = found.get(user_id)
+            if user is None or user_id in seen:
+                continue
+            seen.add(user_id)
+            users.append({k: v for k, v in user.items() if k not in PRIVATE_USER_FIELDS})
+        
+        return respond(ProfilesResponse(
+            success=True,
+            users=users
+        ), 200)
+        
+    except ValidationError:
+        # Let error handlers catch these
+        raise
     except Exception as e:
-        print(f"Profile fetch error: {traceback.format_exc()}")
-        return jsonify({
-            'success': False,
-            'error': 'fetch_failed',
-            'message': 'Could not retrieve profile'
-        }), 500
+        logger.exception("Batch profile fetch error")
+        return respond(ErrorResponse(
+            success=False,
+            error='fetch_failed',
+            message='Could not retrieve profiles'
+        ), 500)
+
+
+# ==================== CORS PREFLIGHT ====================
+
+# Allow header value per API path, filled in by register_api_preflight_routes()
+_API_ALLOWED_METHODS: Dict[str, str] = {}
+
+
+def api_preflight(**_):
+    """Shared OPTIONS handler for API routes (CORS headers added by flask-cors)"""
+    response = app.response_class(status=204)
+    response.headers['Allow'] = _API_ALLOWED_METHODS[request.url_rule.rule]
+    # No body, so no Content-Type
+    del response.headers['Content-Type']
+    return response
+
+
+def register_api_preflight_routes() -> None:
+    """
+    Route OPTIONS for every /api/ rule to api_preflight
+    
+    API routes opt out of Flask's automatic OPTIONS, so this must run after
+    all API routes are declared; routes added later get no preflight.
+    """
+    for rule in list(app.url_map.iter_rules()):
+        if not rule.rule.startswith('/api/') or rule.endpoint == 'api_preflight':
+            continue
+        
+        methods = set(rule.methods) | {'OPTIONS'}
+        if rule.rule in _API_ALLOWED_METHODS:
+            # Another route on the same path; its OPTIONS rule already exists
+            methods |= set(_API_ALLOWED_METHODS[rule.rule].split(', '))
+            _API_ALLOWED_METHODS[rule.rule] = ', '.join(sorted(methods))
+            continue
+        _API_ALLOWED_METHODS[rule.rule] = ', '.join(sorted(methods))
+        
+        app.add_url_rule(
+            rule.rule,
+            'api_preflight',
+            api_preflight,
+            methods=['OPTIONS'],
+            provide_automatic_options=False
+        )
 
 
 # ==================== SERVER STARTUP ====================
 
+# Must stay after every API route declaration (see register_api_preflight_routes)
+register_api_preflight_routes()
+
 if __name__ == '__main__':
     print("="*70)
     print("NeuroTrack API Server")
     print("="*70)
-    print("Starting server on http://localhost:5000")
+    print(f"Starting server on http://localhost:5000 ({FLASK_ENV})")
     print("\nWeb Interface:")
     print("  http://localhost:5000              - Login page")
     print("  http://localhost:5000/pages/login.html")
@@ -320,10 +844,14 @@ if __name__ == '__main__':
     print("  POST /api/auth/login          - Authenticate user")
     print("  POST /api/auth/check-email    - Check email availability")
     print("  GET  /api/users/profile/<id>  - Get user profile")
+    print("  POST /api/users/profiles      - Get multiple user profiles")
+    print("\nProduction:")
+    print("  gunicorn -c gunicorn.conf.py wsgi:application")
     print("="*70)
     
+    # Development server only - use gunicorn (see wsgi.py) in production
     app.run(
         host='0.0.0.0',
         port=5000,
-        debug=True
+        debug=DEBUG
     )
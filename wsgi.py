@@ -0,0 +1,22 @@
+"""
+NeuroTrack WSGI Entry Point
+Production entry for gunicorn with gevent workers
+
+Usage:
+    gunicorn -c gunicorn.conf.py wsgi:application
+"""
+
+# Patch socket/ssl/time/threading BEFORE the app (and backend) are imported
+# so every blocking call made by request handlers yields to the event loop.
+from gevent import monkey
+monkey.patch_all()
+
+# NOTE: backend.database currently persists to JSON files guarded by a
+# threading.Lock, which monkey.patch_all() turns into a gevent-aware lock.
+# If the storage layer moves to a real database, it must use a
+# gevent-compatible driver (e.g. psycopg2 + psycogreen.gevent.patch_psycopg(),
+# or pymysql) or it will block the whole worker.
+
+from main import app
+
+application = app